@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import time
+
+_cached_second = -1
+_cached_prefix = ""
+
+
+def utc_now_iso() -> str:
+    # Same shape as datetime.now(timezone.utc).isoformat(); the seconds prefix is reused until it rolls over.
+    global _cached_second, _cached_prefix
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    if seconds != _cached_second:
+        _cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _cached_second = seconds
+    return f"{_cached_prefix}.{nanos // 1000:06d}+00:00"
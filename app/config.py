@@ -2,19 +2,26 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     host: str
     port: int
     log_level: str
     hmac_secret: str
     hmac_timestamp_tolerance_ms: int
+    max_request_body_bytes: int
     ostium_enabled: bool
     ostium_testnet_rpc_url: str
     ostium_mainnet_rpc_url: str
     ostium_delegate_private_key: str | None
+    ostium_rpc_pool_size: int
+    ostium_pairs_cache_ttl_seconds: float
+    ostium_price_cache_ttl_seconds: float
+    idempotency_ttl_seconds: float
+    idempotency_cache_size: int
 
 
 
@@ -25,6 +32,7 @@ def _to_bool(value: str | None, default: bool) -> bool:
 
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
     return Settings(
         host=os.getenv("HOST", "0.0.0.0"),
@@ -32,8 +40,14 @@ def load_settings() -> Settings:
         log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
         hmac_secret=os.getenv("HMAC_SECRET", ""),
         hmac_timestamp_tolerance_ms=int(os.getenv("HMAC_TIMESTAMP_TOLERANCE_MS", "300000")),
+        max_request_body_bytes=int(os.getenv("MAX_REQUEST_BODY_BYTES", "1048576")),
         ostium_enabled=_to_bool(os.getenv("OSTIUM_ENABLED"), True),
         ostium_testnet_rpc_url=os.getenv("OSTIUM_TESTNET_RPC_URL", "https://sepolia-rollup.arbitrum.io/rpc"),
         ostium_mainnet_rpc_url=os.getenv("OSTIUM_MAINNET_RPC_URL", "https://arb1.arbitrum.io/rpc"),
         ostium_delegate_private_key=os.getenv("OSTIUM_DELEGATE_PRIVATE_KEY") or None,
+        ostium_rpc_pool_size=int(os.getenv("OSTIUM_RPC_POOL_SIZE", "32")),
+        ostium_pairs_cache_ttl_seconds=float(os.getenv("OSTIUM_PAIRS_CACHE_TTL_SECONDS", "60")),
+        ostium_price_cache_ttl_seconds=float(os.getenv("OSTIUM_PRICE_CACHE_TTL_SECONDS", "0.5")),
+        idempotency_ttl_seconds=float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "3600")),
+        idempotency_cache_size=int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "10000")),
     )
@@ -0,0 +1,149 @@
+from __future__ import annotations
+import dataclasses
+from decimal import Decimal
+from typing import Any, Callable
+
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+def _is_json_safe(value: Any) -> bool:
+    # Type-only scan of plain dicts/lists; bails on the first node that would need converting.
+    # A container seen twice also bails, so cycles end here and are reported by the full walk.
+    stack = [value]
+    seen: set[int] = set()
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type in _PRIMITIVE_TYPES:
+            continue
+        if id(item) in seen:
+            return False
+        seen.add(id(item))
+        if item_type is dict:
+            for key, entry in item.items():
+                if type(key) is not str:
+                    return False
+                stack.append(entry)
+        elif item_type is list:
+            stack.extend(item)
+        else:
+            return False
+    return True
+
+def _identity(value: Any) -> Any:
+    return value
+
+# Exact-type conversions for leaf values; everything else falls through to to_json_safe's walk.
+_JSON_SCALARS: dict[type, Callable[[Any], Any]] = {
+    **dict.fromkeys(_PRIMITIVE_TYPES, _identity),
+    Decimal: lambda value: format(value, "f"),
+    bytes: lambda value: "0x" + value.hex(),
+    bytearray: lambda value: "0x" + bytes(value).hex(),
+}
+
+# Marks the point in to_json_safe's work stack where a container's children are all converted.
+_WALK_EXIT = object()
+
+# Straight-line field readers generated per SDK dataclass type the first time one is serialized.
+_JSON_CONVERTERS: dict[type, Callable[[Any], dict[str, Any]]] = {}
+
+def to_json_safe(value: Any) -> Any:
+    # Most SDK payloads are plain JSON already; return those untouched without rebuilding.
+    if type(value) in (dict, list) and _is_json_safe(value):
+        return value
+    # Walks with an explicit stack so deeply nested SDK payloads cannot hit the
+    # recursion limit. Each work item names the slot its converted value goes into.
+    root: list[Any] = [None]
+    stack: list[tuple[Any, Any, Any]] = [(root, 0, value)]
+    # Containers currently being converted. Each is pushed with an exit marker below its
+    # children, so it leaves the set once they are done and shared references still convert.
+    active: set[int] = set()
+
+    def enter(container: Any) -> None:
+        if id(container) in active:
+            raise ValueError("Circular reference detected")
+        active.add(id(container))
+        # The marker also keeps the container alive, so its id cannot be reused meanwhile.
+        stack.append((_WALK_EXIT, None, container))
+
+    while stack:
+        target, slot, item = stack.pop()
+        if target is _WALK_EXIT:
+            active.discard(id(item))
+            continue
+        item_type = type(item)
+        scalar = _JSON_SCALARS.get(item_type)
+        if scalar is not None:
+            target[slot] = scalar(item)
+            continue
+        if item_type is dict or (item_type is not list and isinstance(item, dict)):
+            # Flat dicts of primitives are already JSON-safe; hand them back without copying.
+            if item_type is dict and all(type(key) is str and type(entry) in _PRIMITIVE_TYPES for key, entry in item.items()):
+                target[slot] = item
+                continue
+            enter(item)
+            converted: dict[str, Any] = {}
+            target[slot] = converted
+            children = [(converted, str(key), entry) for key, entry in item.items()]
+            for _, key, _ in children:
+                converted[key] = None
+            # Pushed in reverse so later duplicate str() keys still win, as in a dict comprehension.
+            stack.extend(reversed(children))
+            continue
+        if item_type is list or isinstance(item, (list, tuple, set)):
+            if item_type is list and all(type(entry) in _PRIMITIVE_TYPES for entry in item):
+                target[slot] = item
+                continue
+            # Fill primitives in the same pass and queue only entries that need converting,
+            # so the stack never holds a work item per element of a large list.
+            enter(item)
+            converted_list: list[Any] = [None] * len(item)
+            target[slot] = converted_list
+            for index, entry in enumerate(item):
+                if type(entry) in _PRIMITIVE_TYPES:
+                    converted_list[index] = entry
+                else:
+                    stack.append((converted_list, index, entry))
+            continue
+        converter = _JSON_CONVERTERS.get(item_type)
+        if converter is not None:
+            # The converter only reads the fields; they are converted on this stack like any dict.
+            enter(item)
+            stack.append((target, slot, converter(item)))
+            continue
+        if isinstance(item, Decimal):
+            target[slot] = format(item, "f")
+        elif isinstance(item, (str, int, float, bool)):
+            target[slot] = item
+        elif isinstance(item, (bytes, bytearray)):
+            target[slot] = "0x" + bytes(item).hex()
+        elif (hex_value := _hex_or_none(item)) is not None:
+            target[slot] = hex_value
+        elif hasattr(item, "__dict__"):
+            if dataclasses.is_dataclass(item_type):
+                converter = _JSON_CONVERTERS[item_type] = _build_json_converter(item_type)
+                enter(item)
+                stack.append((target, slot, converter(item)))
+            else:
+                enter(item)
+                stack.append((target, slot, vars(item)))
+        else:
+            target[slot] = str(item)
+    return root[0]
+
+def _hex_or_none(value: Any) -> str | None:
+    if not hasattr(value, "hex"):
+        return None
+    try:
+        hex_value = value.hex()
+    except Exception:
+        return None
+    if not isinstance(hex_value, str):
+        return None
+    return hex_value if hex_value.startswith("0x") else f"0x{hex_value}"
+
+def _build_json_converter(value_type: type) -> Callable[[Any], dict[str, Any]]:
+    # Field names are identifiers, so they can be spliced into source safely.
+    items = ", ".join(f"{field.name!r}: value.{field.name}" for field in dataclasses.fields(value_type))
+    namespace: dict[str, Any] = {}
+    exec(f"def convert(value):\n    return {{{items}}}\n", namespace)
+    return namespace["convert"]
@@ -5,6 +5,10 @@ import logging
 
 
 def configure_logging(level: str) -> None:
+    # The format does not use thread/process fields, so skip collecting them per record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     logging.basicConfig(
         level=level,
         format="%(asctime)s [%(levelname)s] %(name)s %(message)s",
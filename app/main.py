@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.config import load_settings
 from app.logger import configure_logging
@@ -15,7 +18,14 @@ configure_logging(settings.log_level)
 
 adapter = OstiumAdapter(settings)
 
-app = FastAPI(title="FlowForge Ostium Service", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    yield
+    await adapter.aclose()
+
+
+app = FastAPI(title="FlowForge Ostium Service", version="0.1.0", default_response_class=ORJSONResponse, lifespan=lifespan)
 app.add_middleware(RequestContextMiddleware)
 app.add_middleware(HmacAuthMiddleware, settings=settings)
 
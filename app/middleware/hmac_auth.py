@@ -3,79 +3,151 @@ from __future__ import annotations
 import hmac
 import logging
 from hashlib import sha256
-from time import time
+from time import time_ns
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import Settings
 
 LOGGER = logging.getLogger("ostium_service.hmac")
 
 HMAC_HEADERS = {
-    "timestamp": "x-timestamp",
-    "signature": "x-signature",
+    "timestamp": b"x-timestamp",
+    "signature": b"x-signature",
 }
 
 
-class HmacAuthMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, settings: Settings):
-        super().__init__(app)
-        self._settings = settings
-
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path in {"/health", "/ready"}:
-            return await call_next(request)
-
-        if not request.url.path.startswith("/v1/"):
-            return await call_next(request)
-
-        if not self._settings.hmac_secret:
-            return JSONResponse(
-                status_code=500,
-                content={"error": {"code": "SERVER_MISCONFIGURED", "message": "HMAC secret is not configured"}},
-            )
-
-        timestamp = request.headers.get(HMAC_HEADERS["timestamp"])
-        signature = request.headers.get(HMAC_HEADERS["signature"])
+def _error_body(code: str, message: str) -> bytes:
+    return orjson.dumps({"error": {"code": code, "message": message}})
+
+
+_SERVER_MISCONFIGURED = _error_body("SERVER_MISCONFIGURED", "HMAC secret is not configured")
+_UNAUTH_MISSING_HEADERS = _error_body("UNAUTHORIZED", "Missing required authentication headers")
+_UNAUTH_BAD_TIMESTAMP = _error_body("UNAUTHORIZED", "Invalid timestamp format")
+_UNAUTH_EXPIRED = _error_body("UNAUTHORIZED", "Request expired or timestamp too far in future")
+_UNAUTH_BAD_SIGNATURE = _error_body("UNAUTHORIZED", "Invalid signature")
+_PAYLOAD_TOO_LARGE = _error_body("PAYLOAD_TOO_LARGE", "Request body exceeds maximum allowed size")
+
+
+async def _send_json(send: Send, status_code: int, body: bytes) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class _ReplayReceive:
+    """Hands the body buffered during verification to the app once, then falls
+    through to the real channel so disconnects are still observed downstream."""
+
+    __slots__ = ("_receive", "_cached_body", "_is_first_call")
+
+    def __init__(self, receive: Receive, cached_body: bytes):
+        self._receive = receive
+        self._cached_body = cached_body
+        self._is_first_call = True
+
+    async def __call__(self) -> Message:
+        if not self._is_first_call:
+            return await self._receive()
+        self._is_first_call = False
+        return {"type": "http.request", "body": self._cached_body, "more_body": False}
+
+
+class HmacAuthMiddleware:
+    def __init__(self, app: ASGIApp, settings: Settings):
+        self.app = app
+        self._key = settings.hmac_secret.encode("utf-8")
+        # Keyed inner/outer pads are derived once; each request copies this state.
+        self._hmac_template = hmac.new(self._key, None, sha256)
+        self._tolerance_ms = settings.hmac_timestamp_tolerance_ms
+        self._max_body_bytes = settings.max_request_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Only /v1/* is authenticated; /health, /ready and docs fall through here.
+        # raw_path is optional in the ASGI spec, so fall back to the decoded path.
+        path = scope.get("raw_path") or scope["path"].encode("utf-8")
+        if not path.startswith(b"/v1/"):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._key:
+            await _send_json(send, 500, _SERVER_MISCONFIGURED)
+            return
+
+        timestamp = signature = content_length = None
+        for key, value in scope["headers"]:
+            if key == HMAC_HEADERS["timestamp"]:
+                timestamp = value
+            elif key == HMAC_HEADERS["signature"]:
+                signature = value
+            elif key == b"content-length":
+                content_length = value
 
         if not timestamp or not signature:
-            return JSONResponse(
-                status_code=401,
-                content={"error": {"code": "UNAUTHORIZED", "message": "Missing required authentication headers"}},
-            )
+            await _send_json(send, 401, _UNAUTH_MISSING_HEADERS)
+            return
 
         try:
             request_ts = int(timestamp)
         except ValueError:
-            return JSONResponse(
-                status_code=401,
-                content={"error": {"code": "UNAUTHORIZED", "message": "Invalid timestamp format"}},
-            )
-
-        now_ms = int(time() * 1000)
-        if abs(now_ms - request_ts) > self._settings.hmac_timestamp_tolerance_ms:
-            return JSONResponse(
-                status_code=401,
-                content={"error": {"code": "UNAUTHORIZED", "message": "Request expired or timestamp too far in future"}},
-            )
-
-        body_bytes = await request.body()
-        body_str = body_bytes.decode("utf-8") if body_bytes else ""
-        payload = f"{timestamp}:{request.method.upper()}:{request.url.path}:{body_str}"
-
-        expected = hmac.new(
-            self._settings.hmac_secret.encode("utf-8"),
-            payload.encode("utf-8"),
-            sha256,
-        ).hexdigest()
-
-        if not hmac.compare_digest(expected, signature):
-            LOGGER.warning("HMAC verification failed", extra={"path": request.url.path})
-            return JSONResponse(
-                status_code=401,
-                content={"error": {"code": "UNAUTHORIZED", "message": "Invalid signature"}},
-            )
-
-        return await call_next(request)
+            await _send_json(send, 401, _UNAUTH_BAD_TIMESTAMP)
+            return
+
+        try:
+            signature_bytes = bytes.fromhex(signature.decode("ascii"))
+        except ValueError:
+            await _send_json(send, 401, _UNAUTH_BAD_SIGNATURE)
+            return
+
+        now_ms = time_ns() // 1_000_000
+        if abs(now_ms - request_ts) > self._tolerance_ms:
+            await _send_json(send, 401, _UNAUTH_EXPIRED)
+            return
+
+        if content_length and content_length.isdigit() and int(content_length) > self._max_body_bytes:
+            await _send_json(send, 413, _PAYLOAD_TOO_LARGE)
+            return
+
+        digest = self._hmac_template.copy()
+        digest.update(timestamp)
+        digest.update(b":")
+        digest.update(scope["method"].encode("latin-1"))
+        digest.update(b":")
+        digest.update(path)
+        digest.update(b":")
+
+        # Content-Length may be absent (chunked uploads), so the cap is enforced
+        # while streaming too.
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunk = message.get("body", b"")
+            if len(body) + len(chunk) > self._max_body_bytes:
+                await _send_json(send, 413, _PAYLOAD_TOO_LARGE)
+                return
+            digest.update(chunk)
+            body += chunk
+            if not message.get("more_body", False):
+                break
+
+        if not hmac.compare_digest(digest.digest(), signature_bytes):
+            LOGGER.warning("HMAC verification failed for %s", scope["path"])
+            await _send_json(send, 401, _UNAUTH_BAD_SIGNATURE)
+            return
+
+        await self.app(scope, _ReplayReceive(receive, bytes(body)), send)
@@ -2,15 +2,31 @@ from __future__ import annotations
 
 from uuid import uuid4
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request_id = request.headers.get("x-request-id") or str(uuid4())
-        request.state.request_id = request_id
+class RequestContextMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        response = await call_next(request)
-        response.headers["x-request-id"] = request_id
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for key, value in scope["headers"]:
+            if key == b"x-request-id" and value:
+                request_id = value.decode("latin-1")
+                break
+        else:
+            request_id = uuid4().hex
+        # Starlette's request.state is backed by scope["state"].
+        scope.setdefault("state", {})["request_id"] = request_id
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-
 from fastapi import APIRouter
 
+from app.clock import utc_now_iso
 from app.config import Settings
 from app.services.ostium_adapter import OstiumAdapter
 
@@ -17,7 +16,7 @@ def build_health_router(settings: Settings, adapter: OstiumAdapter) -> APIRouter
         return {
             "status": "healthy",
             "service": "flowforge-ostium-service",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
 
     @router.get("/ready")
@@ -26,12 +25,12 @@ def build_health_router(settings: Settings, adapter: OstiumAdapter) -> APIRouter
         if is_ready:
             return {
                 "status": "ready",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
         return {
             "status": "not ready",
             "reason": reason,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
 
     return router
@@ -1,42 +1,127 @@
 from __future__ import annotations
+import functools
+import inspect
+import json
 import logging
+from typing import Any, AsyncIterator, Awaitable, Callable
+import orjson
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from app.clock import utc_now_iso
+from app.json_safe import to_json_safe
 from app.schemas.common import ErrorBody, ErrorEnvelope, Meta, SuccessEnvelope
 from app.services.ostium_adapter import OstiumServiceError
 
 LOGGER = logging.getLogger("ostium_service.routes.v1")
 
+# Items encoded per chunk written to the wire by streamed list responses.
+_STREAM_BATCH_SIZE = 256
+
+def _json_default(value: Any) -> Any:
+    # orjson only calls this for types it cannot encode natively; they get the
+    # same conversions the managers apply to SDK results.
+    converted = to_json_safe(value)
+    return str(value) if converted is value else converted
+
+class EnvelopeResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
 def _meta(request: Request) -> Meta:
-    return Meta(requestId=getattr(request.state, "request_id", "unknown"))
+    return {"timestamp": utc_now_iso(), "requestId": getattr(request.state, "request_id", "unknown")}
+
+def _success(request: Request, data: dict) -> EnvelopeResponse:
+    envelope: SuccessEnvelope = {"success": True, "data": data, "meta": _meta(request)}
+    return EnvelopeResponse(envelope)
+
+def _dumps(value: Any) -> bytes:
+    try:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # orjson rejects ints wider than 64 bits (on-chain amounts) before calling default.
+        return json.dumps(value, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+def _encode_items(items: list[Any]) -> bytes:
+    return b",".join(_dumps(item) for item in items)
 
-def _success(request: Request, data: dict) -> SuccessEnvelope:
-    return SuccessEnvelope(success=True, data=data, meta=_meta(request))
+async def stream_json_list(head: bytes, items: list[Any], suffix: bytes, list_key: str) -> AsyncIterator[bytes]:
+    # Encodes the list a batch at a time so only one batch of bytes is held, not the whole body.
+    yield head
+    try:
+        for start in range(0, len(items), _STREAM_BATCH_SIZE):
+            yield b"," + _encode_items(items[start:start + _STREAM_BATCH_SIZE])
+    except Exception:
+        # The 200 status is already on the wire; abort the body so the client sees a truncated transfer.
+        LOGGER.exception("Failed to encode streamed %s", list_key)
+        raise
+    yield suffix
 
-def _error(request: Request, code: str, message: str, details: dict | None = None, retryable: bool | None = None) -> ErrorEnvelope:
-    return ErrorEnvelope(
-        success=False,
-        error=ErrorBody(code=code, message=message, details=details, retryable=retryable),
-        meta=_meta(request),
+def _stream_success(request: Request, data: dict, list_key: str) -> Response:
+    # Same bytes as _success, with data[list_key] written last and streamed.
+    items = data[list_key]
+    head = {key: value for key, value in data.items() if key != list_key}
+    head_bytes = _dumps(head)[:-1] + (b"," if head else b"")
+    # The first batch is encoded before any response is built, so a failure on it
+    # still reaches the caller's error handling as a normal error envelope.
+    first = b'{"success":true,"data":' + head_bytes + _dumps(list_key) + b":[" + _encode_items(items[:_STREAM_BATCH_SIZE])
+    suffix = b']},"meta":' + _dumps(_meta(request)) + b"}"
+    if len(items) <= _STREAM_BATCH_SIZE:
+        return Response(first + suffix, media_type="application/json")
+    return StreamingResponse(
+        stream_json_list(first, items[_STREAM_BATCH_SIZE:], suffix, list_key), media_type="application/json"
     )
 
-def error_response(request: Request, exc: OstiumServiceError) -> JSONResponse:
-    payload = _error(
+def _error(
+    request: Request,
+    status_code: int,
+    code: str,
+    message: str,
+    details: dict | None = None,
+    retryable: bool | None = None,
+) -> EnvelopeResponse:
+    error: ErrorBody = {"code": code, "message": message, "details": details, "retryable": retryable}
+    envelope: ErrorEnvelope = {"success": False, "error": error, "meta": _meta(request)}
+    return EnvelopeResponse(envelope, status_code=status_code)
+
+def error_response(request: Request, exc: OstiumServiceError) -> EnvelopeResponse:
+    return _error(
         request,
+        status_code=exc.status_code,
         code=exc.code,
         message=exc.message,
         details=exc.details,
         retryable=exc.retryable,
-    ).model_dump()
-    return JSONResponse(status_code=exc.status_code, content=payload)
+    )
 
-def unexpected_error_response(request: Request, operation: str, exc: Exception) -> JSONResponse:
+def unexpected_error_response(request: Request, operation: str, exc: Exception) -> EnvelopeResponse:
     LOGGER.exception("Unhandled exception in %s", operation)
-    payload = _error(
+    return _error(
         request,
+        status_code=500,
         code="OSTIUM_INTERNAL_ERROR",
         message=f"Unexpected failure while processing {operation}",
         details={"error": str(exc), "type": type(exc).__name__, "operation": operation},
         retryable=False,
-    ).model_dump()
-    return JSONResponse(status_code=500, content=payload)
+    )
+
+def handle_ostium_errors(operation: str, stream_list: str | None = None) -> Callable:
+    # stream_list names a list in the handler's result to stream instead of encoding in one body.
+    def decorator(handler: Callable[..., Awaitable[dict]]) -> Callable:
+        @functools.wraps(handler)
+        async def wrapper(payload: Any, request: Request):
+            try:
+                data = await handler(payload, request)
+                if stream_list is not None:
+                    return _stream_success(request, data, stream_list)
+                return _success(request, data)
+            except OstiumServiceError as exc:
+                return error_response(request, exc)
+            except Exception as exc:
+                return unexpected_error_response(request, operation, exc)
+
+        # Resolve the handler's string annotations here; FastAPI would otherwise
+        # evaluate them against this module's globals.
+        wrapper.__signature__ = inspect.signature(handler, eval_str=True)
+        return wrapper
+
+    return decorator
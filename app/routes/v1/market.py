@@ -1,60 +1,35 @@
 from __future__ import annotations
 from fastapi import APIRouter, Request
 from app.schemas.ostium import PriceRequest, MarketsListRequest, MarketFundingRequest, MarketDetailsRequest
-from app.services.ostium_adapter import OstiumAdapter, OstiumServiceError
-from .common import _success, error_response, unexpected_error_response
+from app.services.ostium_adapter import OstiumAdapter
+from .common import handle_ostium_errors
 
 def build_market_router(adapter: OstiumAdapter) -> APIRouter:
     router = APIRouter()
 
     @router.post("/markets/list")
+    @handle_ostium_errors("markets/list")
     async def markets_list(payload: MarketsListRequest, request: Request):
-        try:
-            data = await adapter.list_markets(payload.network)
-            return _success(request, data)
-        except OstiumServiceError as exc:
-            return error_response(request, exc)
-        except Exception as exc:
-            return unexpected_error_response(request, "markets/list", exc)
+        return await adapter.list_markets(payload.network)
 
     @router.post("/prices/get")
+    @handle_ostium_errors("prices/get")
     async def prices_get(payload: PriceRequest, request: Request):
-        try:
-            data = await adapter.get_price(payload.network, payload.base, payload.quote)
-            return _success(request, data)
-        except OstiumServiceError as exc:
-            return error_response(request, exc)
-        except Exception as exc:
-            return unexpected_error_response(request, "prices/get", exc)
+        return await adapter.get_price(payload.network, payload.base, payload.quote)
 
     @router.post("/markets/funding-rate")
+    @handle_ostium_errors("markets/funding-rate")
     async def markets_funding_rate(payload: MarketFundingRequest, request: Request):
-        try:
-            data = await adapter.get_funding_rate(payload.network, payload.pairId, payload.periodHours)
-            return _success(request, data)
-        except OstiumServiceError as exc:
-            return error_response(request, exc)
-        except Exception as exc:
-            return unexpected_error_response(request, "markets/funding-rate", exc)
+        return await adapter.get_funding_rate(payload.network, payload.pairId, payload.periodHours)
 
     @router.post("/markets/rollover-rate")
+    @handle_ostium_errors("markets/rollover-rate")
     async def markets_rollover_rate(payload: MarketFundingRequest, request: Request):
-        try:
-            data = await adapter.get_rollover_rate(payload.network, payload.pairId, payload.periodHours)
-            return _success(request, data)
-        except OstiumServiceError as exc:
-            return error_response(request, exc)
-        except Exception as exc:
-            return unexpected_error_response(request, "markets/rollover-rate", exc)
+        return await adapter.get_rollover_rate(payload.network, payload.pairId, payload.periodHours)
 
     @router.post("/markets/details")
+    @handle_ostium_errors("markets/details")
     async def markets_details(payload: MarketDetailsRequest, request: Request):
-        try:
-            data = await adapter.get_market_details(payload.network, payload.pairId)
-            return _success(request, data)
-        except OstiumServiceError as exc:
-            return error_response(request, exc)
-        except Exception as exc:
-            return unexpected_error_response(request, "markets/details", exc)
+        return await adapter.get_market_details(payload.network, payload.pairId)
 
     return router
@@ -8,70 +8,40 @@ from app.schemas.ostium import (
     PositionMetricsRequest,
     PositionsListRequest
 )
-from app.services.ostium_adapter import OstiumAdapter, OstiumServiceError
-from .common import _success, error_response, unexpected_error_response
+from app.services.ostium_adapter import OstiumAdapter
+from .common import handle_ostium_errors
 
 def build_trading_router(adapter: OstiumAdapter) -> APIRouter:
     router = APIRouter()
 
     @router.post("/positions/list")
+    @handle_ostium_errors("positions/list", stream_list="positions")
     async def positions_list(payload: PositionsListRequest, request: Request):
-        try:
-            data = await adapter.list_positions(payload.network, payload.traderAddress)
-            return _success(request, data)
-        except OstiumServiceError as exc:
-            return error_response(request, exc)
-        except Exception as exc:
-            return unexpected_error_response(request, "positions/list", exc)
+        return await adapter.list_positions(payload.network, payload.traderAddress)
 
     @router.post("/positions/open")
+    @handle_ostium_errors("positions/open")
     async def positions_open(payload: PositionOpenRequest, request: Request):
-        try:
-            data = await adapter.open_position(payload.model_dump())
-            return _success(request, data)
-        except OstiumServiceError as exc:
-            return error_response(request, exc)
-        except Exception as exc:
-            return unexpected_error_response(request, "positions/open", exc)
+        return await adapter.open_position(payload)
 
     @router.post("/positions/close")
+    @handle_ostium_errors("positions/close")
     async def positions_close(payload: PositionCloseRequest, request: Request):
-        try:
-            data = await adapter.close_position(payload.model_dump())
-            return _success(request, data)
-        except OstiumServiceError as exc:
-            return error_response(request, exc)
-        except Exception as exc:
-            return unexpected_error_response(request, "positions/close", exc)
+        return await adapter.close_position(payload)
 
     @router.post("/positions/update-sl")
+    @handle_ostium_errors("positions/update-sl")
     async def positions_update_sl(payload: PositionUpdateSlRequest, request: Request):
-        try:
-            data = await adapter.update_sl(payload.model_dump())
-            return _success(request, data)
-        except OstiumServiceError as exc:
-            return error_response(request, exc)
-        except Exception as exc:
-            return unexpected_error_response(request, "positions/update-sl", exc)
+        return await adapter.update_sl(payload)
 
     @router.post("/positions/update-tp")
+    @handle_ostium_errors("positions/update-tp")
     async def positions_update_tp(payload: PositionUpdateTpRequest, request: Request):
-        try:
-            data = await adapter.update_tp(payload.model_dump())
-            return _success(request, data)
-        except OstiumServiceError as exc:
-            return error_response(request, exc)
-        except Exception as exc:
-            return unexpected_error_response(request, "positions/update-tp", exc)
+        return await adapter.update_tp(payload)
 
     @router.post("/positions/metrics")
+    @handle_ostium_errors("positions/metrics")
     async def positions_metrics(payload: PositionMetricsRequest, request: Request):
-        try:
-            data = await adapter.get_position_metrics(payload.model_dump())
-            return _success(request, data)
-        except OstiumServiceError as exc:
-            return error_response(request, exc)
-        except Exception as exc:
-            return unexpected_error_response(request, "positions/metrics", exc)
+        return await adapter.get_position_metrics(payload)
 
     return router
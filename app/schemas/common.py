@@ -1,30 +1,29 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any
+from typing import Any, TypedDict
 
-from pydantic import BaseModel, Field
 
-
-class Meta(BaseModel):
-    timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+# Response envelopes are only ever produced by this service, never validated,
+# so they are plain dicts typed for readers and handed straight to orjson.
+class Meta(TypedDict):
+    timestamp: str
     requestId: str
 
 
-class ErrorBody(BaseModel):
+class ErrorBody(TypedDict):
     code: str
     message: str
-    details: dict[str, Any] | None = None
-    retryable: bool | None = None
+    details: dict[str, Any] | None
+    retryable: bool | None
 
 
-class SuccessEnvelope(BaseModel):
-    success: bool = True
+class SuccessEnvelope(TypedDict):
+    success: bool
     data: dict[str, Any]
     meta: Meta
 
 
-class ErrorEnvelope(BaseModel):
-    success: bool = False
+class ErrorEnvelope(TypedDict):
+    success: bool
     error: ErrorBody
     meta: Meta
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from .base import NetworkedRequest
 from .market import PriceRequest, MarketsListRequest, MarketFundingRequest, MarketDetailsRequest
-from .accounts import BalanceRequest, PositionsListRequest, FaucetRequest
+from .accounts import BalanceRequest, PositionsListRequest, AccountSnapshotRequest, FaucetRequest
 from .trading import (
     PositionOpenRequest, 
     PositionCloseRequest, 
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from pydantic import Field
 from .base import NetworkedRequest
 
 class BalanceRequest(NetworkedRequest):
@@ -7,5 +8,9 @@ class BalanceRequest(NetworkedRequest):
 class PositionsListRequest(NetworkedRequest):
     traderAddress: str
 
+class AccountSnapshotRequest(NetworkedRequest):
+    traderAddress: str
+    historyLimit: int = Field(default=20, gt=0, le=100)
+
 class FaucetRequest(NetworkedRequest):
     traderAddress: str | None = None
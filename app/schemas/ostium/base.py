@@ -1,13 +1,12 @@
 from __future__ import annotations
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+# Validated and normalized by pydantic-core; the (?i) flag keeps intake case-insensitive.
+Network = Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True, pattern=r"(?i)^(testnet|mainnet)$")]
 
 class NetworkedRequest(BaseModel):
-    network: str = Field(description="testnet or mainnet")
+    # Request models are read-only once validated.
+    model_config = ConfigDict(frozen=True)
 
-    @field_validator("network")
-    @classmethod
-    def validate_network(cls, value: str) -> str:
-        normalized = value.strip().lower()
-        if normalized not in {"testnet", "mainnet"}:
-            raise ValueError("network must be testnet or mainnet")
-        return normalized
+    network: Network = Field(description="testnet or mainnet")
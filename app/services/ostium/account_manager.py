@@ -7,8 +7,10 @@ class AccountManager(BaseManager):
     async def get_balance(self, network: str, address: str) -> dict[str, Any]:
         sdk = self._build_sdk(network)
         try:
-            usdc = await asyncio.to_thread(sdk.balance.get_usdc_balance, address)
-            native = await asyncio.to_thread(sdk.balance.get_ether_balance, address)
+            usdc, native = await asyncio.gather(
+                self._run_blocking(sdk.balance.get_usdc_balance, address),
+                self._run_blocking(sdk.balance.get_ether_balance, address),
+            )
         except Exception as exc:
             raise OstiumServiceError(code="BALANCE_FETCH_FAILED", message="Failed to fetch balances", status_code=502, details={"error": str(exc)}) from exc
         return {"network": network, "address": address, "balances": {"usdc": self._to_json_safe(usdc), "native": self._to_json_safe(native)}}
@@ -19,7 +21,7 @@ class AccountManager(BaseManager):
             positions = await sdk.subgraph.get_open_trades(trader_address)
         except Exception as exc:
             raise OstiumServiceError(code="POSITIONS_FETCH_FAILED", message="Failed to fetch positions", status_code=502, details={"error": str(exc)}) from exc
-        return {"network": network, "traderAddress": trader_address, "positions": self._to_json_safe(positions if isinstance(positions, list) else [])}
+        return {"network": network, "traderAddress": trader_address, "positions": self._to_json_safe(positions) if isinstance(positions, list) else []}
 
     async def get_history(self, network: str, trader_address: str, limit: int = 20) -> dict[str, Any]:
         sdk = self._build_sdk(network)
@@ -27,7 +29,30 @@ class AccountManager(BaseManager):
             history = await sdk.subgraph.get_recent_history(trader_address, last_n_orders=limit)
         except Exception as exc:
             raise OstiumServiceError(code="HISTORY_FETCH_FAILED", message="Failed to fetch history", status_code=502, details={"error": str(exc)}) from exc
-        return {"network": network, "traderAddress": trader_address, "history": self._to_json_safe(history if isinstance(history, list) else [])}
+        return {"network": network, "traderAddress": trader_address, "history": self._to_json_safe(history) if isinstance(history, list) else []}
+
+    async def get_account_snapshot(self, network: str, trader_address: str, history_limit: int = 20) -> dict[str, Any]:
+        sdk = self._build_sdk(network)
+        results = await asyncio.gather(
+            sdk.subgraph.get_open_trades(trader_address),
+            sdk.subgraph.get_orders(trader_address),
+            sdk.subgraph.get_recent_history(trader_address, last_n_orders=history_limit),
+            return_exceptions=True,
+        )
+        # A failed section is reported alongside the others instead of failing the whole snapshot.
+        snapshot: dict[str, Any] = {"network": network, "traderAddress": trader_address}
+        errors: dict[str, Any] = {}
+        for section, code, result in zip(("positions", "orders", "history"), ("POSITIONS_FETCH_FAILED", "ORDERS_FETCH_FAILED", "HISTORY_FETCH_FAILED"), results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception): raise result
+                snapshot[section] = None
+                errors[section] = {"code": code, "message": f"Failed to fetch {section}", "details": {"error": str(result)}, "retryable": True}
+            else:
+                snapshot[section] = self._to_json_safe(result) if isinstance(result, list) else []
+        if len(errors) == len(results):
+            raise OstiumServiceError(code="ACCOUNT_SNAPSHOT_FAILED", message="Failed to fetch account snapshot", status_code=502, retryable=True, details=errors)
+        snapshot["errors"] = errors
+        return snapshot
 
     async def request_faucet(self, network: str, trader_address: str | None = None) -> dict[str, Any]:
         if network != "testnet": raise OstiumServiceError(code="FAUCET_NOT_AVAILABLE", message="Faucet is testnet only", status_code=400)
@@ -39,10 +64,10 @@ class AccountManager(BaseManager):
             if not method: result = "Manual request required"
             else:
                 try:
-                    result = await asyncio.to_thread(method, target)
+                    result = await self._run_blocking(method, target)
                 except TypeError as e:
                     if "argument" in str(e):
-                        result = await asyncio.to_thread(method)
+                        result = await self._run_blocking(method)
                     else:
                         raise
             return {"network": network, "address": target, "status": "submitted", "result": self._to_json_safe(result)}
@@ -1,11 +1,17 @@
 from __future__ import annotations
 import asyncio
+import functools
+import hashlib
+import inspect
 import logging
+import re
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import Any
+from typing import Any, Awaitable, Callable
 from app.config import Settings
+from app.json_safe import to_json_safe
 
 try:
     from ostium_python_sdk import OstiumSDK  # type: ignore
@@ -15,109 +21,297 @@ except Exception:
 LOGGER = logging.getLogger("ostium_service.adapter")
 _DUMMY_PRIVATE_KEY = "0x" + ("1" * 64)
 
-@dataclass(frozen=True)
+# SDK construction sets up providers, contracts and clients, so instances are shared
+# by every manager and reused across requests for the same (network, signing key).
+# Keys are fingerprinted so the cache never holds raw private keys. Requests must not
+# change state on a shared instance; per-call settings such as slippage go on a copy.
+_SDK_CACHE: dict[tuple[str, str | None], Any] = {}
+
+# Blocking SDK calls get their own pool so slow RPCs cannot starve the loop's default executor.
+_SDK_EXECUTOR: ThreadPoolExecutor | None = None
+
+# Checked in order; the first matching rule classifies the SDK error.
+_SDK_ERROR_RULES: tuple[tuple[re.Pattern[str], str, str, int, bool], ...] = (
+    (
+        re.compile(r"sufficient allowance|allowance for", re.IGNORECASE),
+        "ALLOWANCE_MISSING",
+        "Sufficient allowance not present. Approve the trading contract to spend USDC.",
+        400,
+        False,
+    ),
+    (
+        re.compile(r"delegation (?:is )?not active", re.IGNORECASE),
+        "DELEGATION_NOT_ACTIVE",
+        "Delegation is not active. Approve delegation before write actions.",
+        400,
+        False,
+    ),
+    (
+        re.compile(r"safe wallet not found", re.IGNORECASE),
+        "SAFE_WALLET_MISSING",
+        "Safe wallet not found for selected network.",
+        400,
+        False,
+    ),
+    (
+        re.compile(r"delegate wallet gas is low|insufficient funds for gas", re.IGNORECASE),
+        "DELEGATE_GAS_LOW",
+        "Delegate wallet gas is low. Fund delegate wallet with ETH.",
+        400,
+        False,
+    ),
+    (
+        re.compile(r"timeout|timed out", re.IGNORECASE),
+        "OSTIUM_SERVICE_TIMEOUT",
+        "Ostium service timed out.",
+        504,
+        True,
+    ),
+)
+
 class OstiumServiceError(Exception):
-    code: str
-    message: str
-    status_code: int = 400
-    retryable: bool | None = None
-    details: dict[str, Any] | None = None
+    __slots__ = ("code", "message", "status_code", "retryable", "details")
+
+    def __init__(
+        self,
+        *,
+        code: str,
+        message: str,
+        status_code: int = 400,
+        retryable: bool | None = None,
+        details: dict[str, Any] | None = None,
+    ):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+        self.retryable = retryable
+        self.details = details
 
     def __str__(self) -> str:
         return self.message
 
+class _IdempotencyStore:
+    # Shared by every manager so a retried key is recognised whichever manager handles it.
+    # Only touched from the event loop thread and get/set never await, so no lock is needed.
+    # Entries stay in creation order, so both expiry and the size cap pop from the front.
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+        self._pending: dict[tuple[str, str], asyncio.Future[dict[str, Any]]] = {}
+
+    async def acquire(self, key: tuple[str, str]) -> dict[str, Any] | None:
+        # Returns the stored response, or None once the caller owns the key and must release it.
+        payload = self.get(key)
+        if payload is not None:
+            return payload
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = asyncio.get_running_loop().create_future()
+            return None
+        # A duplicate in flight: share its outcome, failure included, instead of
+        # submitting the operation a second time.
+        return await asyncio.shield(pending)
+
+    def release(
+        self,
+        key: tuple[str, str],
+        payload: dict[str, Any] | None,
+        error: BaseException | None = None,
+    ) -> None:
+        if payload is not None:
+            self.set(key, payload)
+        pending = self._pending.pop(key, None)
+        if pending is None or pending.done():
+            return
+        if error is None:
+            pending.set_result(payload)
+        else:
+            pending.set_exception(error)
+            # Mark it retrieved so a failure nobody waited on is not logged by asyncio.
+            pending.exception()
+
+    def get(self, key: tuple[str, str]) -> dict[str, Any] | None:
+        self._expire(time.monotonic())
+        item = self._entries.get(key)
+        return item[1] if item else None
+
+    def set(self, key: tuple[str, str], payload: dict[str, Any]) -> None:
+        now = time.monotonic()
+        entries = self._entries
+        entries[key] = (now, payload)
+        entries.move_to_end(key)
+        self._expire(now)
+        while len(entries) > self._max_entries:
+            entries.popitem(last=False)
+
+    def _expire(self, now: float) -> None:
+        entries = self._entries
+        cutoff = now - self._ttl_seconds
+        while entries:
+            created_at, _ = next(iter(entries.values()))
+            if created_at >= cutoff:
+                break
+            entries.popitem(last=False)
+
+_IDEMPOTENCY: _IdempotencyStore | None = None
+
+def _key_fingerprint(private_key: str | None) -> str | None:
+    if private_key is None:
+        return None
+    return hashlib.sha256(private_key.encode("utf-8")).hexdigest()[:16]
+
+def shutdown_sdk_executor() -> None:
+    global _SDK_EXECUTOR
+    executor, _SDK_EXECUTOR = _SDK_EXECUTOR, None
+    if executor is not None:
+        # Don't block shutdown on in-flight RPCs; queued calls are dropped.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+async def close_sdk_clients() -> None:
+    # The SDK has no single close hook, so close whatever session-like clients it exposes.
+    sdks = list(_SDK_CACHE.values())
+    _SDK_CACHE.clear()
+    for sdk in sdks:
+        for client in (sdk, getattr(sdk, "subgraph", None), getattr(sdk, "price", None)):
+            close = getattr(client, "aclose", None) or getattr(client, "close", None)
+            if not callable(close):
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                LOGGER.debug("Failed to close Ostium SDK client %r", client, exc_info=True)
+
 class BaseManager:
     def __init__(self, settings: Settings):
         self._settings = settings
-        self._idempotency_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        # Neither can change at runtime, so _build_sdk only needs one flag check per call.
+        self._sdk_ready = settings.ostium_enabled and OstiumSDK is not None
+        self._delegate_key = settings.ostium_delegate_private_key or None
+        self._rpc_by_network = {
+            "testnet": settings.ostium_testnet_rpc_url,
+            "mainnet": settings.ostium_mainnet_rpc_url,
+        }
 
     def _network_rpc(self, network: str) -> str:
-        if network == "testnet":
-            return self._settings.ostium_testnet_rpc_url
-        if network == "mainnet":
-            return self._settings.ostium_mainnet_rpc_url
-        raise OstiumServiceError(
-            code="INVALID_NETWORK",
-            message="network must be testnet or mainnet",
-            status_code=400,
-            retryable=False,
-        )
+        try:
+            return self._rpc_by_network[network]
+        except KeyError:
+            raise OstiumServiceError(
+                code="INVALID_NETWORK",
+                message="network must be testnet or mainnet",
+                status_code=400,
+                retryable=False,
+            ) from None
 
     def _build_sdk(self, network: str, private_key: str | None = None):
+        if not self._sdk_ready:
+            raise self._sdk_unavailable_error()
+
+        cache_key = (network, _key_fingerprint(private_key))
+        sdk = _SDK_CACHE.get(cache_key)
+        if sdk is None:
+            rpc_url = self._network_rpc(network)
+            sdk = OstiumSDK(
+                network=network,
+                private_key=private_key or _DUMMY_PRIVATE_KEY,
+                rpc_url=rpc_url,
+                use_delegation=bool(private_key and self._delegate_key),
+            )
+            _SDK_CACHE[cache_key] = sdk
+        return sdk
+
+    def _sdk_unavailable_error(self) -> OstiumServiceError:
         if not self._settings.ostium_enabled:
-            raise OstiumServiceError(
+            return OstiumServiceError(
                 code="OSTIUM_DISABLED",
                 message="Ostium is disabled by configuration",
                 status_code=503,
                 retryable=False,
             )
-        if OstiumSDK is None:
-            raise OstiumServiceError(
-                code="SDK_UNAVAILABLE",
-                message="Ostium SDK is not available in runtime",
-                status_code=503,
-                retryable=False,
+        return OstiumServiceError(
+            code="SDK_UNAVAILABLE",
+            message="Ostium SDK is not available in runtime",
+            status_code=503,
+            retryable=False,
+        )
+
+    def _sdk_executor(self) -> ThreadPoolExecutor:
+        global _SDK_EXECUTOR
+        if _SDK_EXECUTOR is None:
+            _SDK_EXECUTOR = ThreadPoolExecutor(
+                max_workers=self._settings.ostium_rpc_pool_size,
+                thread_name_prefix="ostium-rpc",
             )
+        return _SDK_EXECUTOR
 
-        rpc_url = self._network_rpc(network)
-        return OstiumSDK(
-            network=network,
-            private_key=private_key or _DUMMY_PRIVATE_KEY,
-            rpc_url=rpc_url,
-            use_delegation=bool(private_key and self._settings.ostium_delegate_private_key),
-        )
+    def _idempotency_store(self) -> _IdempotencyStore:
+        global _IDEMPOTENCY
+        if _IDEMPOTENCY is None:
+            _IDEMPOTENCY = _IdempotencyStore(
+                ttl_seconds=self._settings.idempotency_ttl_seconds,
+                max_entries=self._settings.idempotency_cache_size,
+            )
+        return _IDEMPOTENCY
+
+    async def _run_blocking(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        # Unlike asyncio.to_thread this does not copy contextvars into the worker; SDK calls
+        # don't read any, so the per-call context copy is skipped on purpose.
+        loop = asyncio.get_running_loop()
+        if kwargs:
+            fn = functools.partial(fn, *args, **kwargs)
+            args = ()
+        return await loop.run_in_executor(self._sdk_executor(), fn, *args)
 
     def _ensure_delegate_key(self) -> str:
-        if not self._settings.ostium_delegate_private_key:
+        if self._delegate_key is None:
             raise OstiumServiceError(
                 code="DELEGATE_KEY_MISSING",
                 message="OSTIUM_DELEGATE_PRIVATE_KEY is not configured",
                 status_code=503,
                 retryable=False,
             )
-        return self._settings.ostium_delegate_private_key
+        return self._delegate_key
 
-    def _idempotency_get(self, key: str | None) -> dict[str, Any] | None:
+    async def _idempotent(
+        self,
+        operation_name: str,
+        key: str | None,
+        operation: Callable[[Any], Awaitable[dict[str, Any]]],
+        req: Any,
+    ) -> dict[str, Any]:
         if not key:
-            return None
-        item = self._idempotency_cache.get(key)
-        if not item:
-            return None
-        created_at, payload = item
-        if time.time() - created_at > 3600:
-            self._idempotency_cache.pop(key, None)
-            return None
-        return payload
+            return await operation(req)
+        # Keys are scoped per operation so reusing one across endpoints never replays the wrong response.
+        scoped_key = (operation_name, key)
+        store = self._idempotency_store()
+        existing = await store.acquire(scoped_key)
+        if existing is not None:
+            return existing
+        try:
+            response = await operation(req)
+        except asyncio.CancelledError:
+            aborted = OstiumServiceError(
+                code="IDEMPOTENT_REQUEST_ABORTED",
+                message="The original request with this idempotency key was aborted",
+                status_code=409,
+                retryable=True,
+            )
+            store.release(scoped_key, None, aborted)
+            raise
+        except Exception as exc:
+            # Duplicates in flight receive the same failure; the key is not cached,
+            # so a later retry runs the operation again.
+            store.release(scoped_key, None, exc)
+            raise
+        store.release(scoped_key, response)
+        return response
 
-    def _idempotency_set(self, key: str | None, payload: dict[str, Any]) -> None:
-        if not key:
-            return
-        self._idempotency_cache[key] = (time.time(), payload)
-
-    @classmethod
-    def _to_json_safe(cls, value: Any) -> Any:
-        if isinstance(value, Decimal):
-            return format(value, "f")
-        if value is None or isinstance(value, (str, int, float, bool)):
-            return value
-        if isinstance(value, bytes):
-            return "0x" + value.hex()
-        if isinstance(value, bytearray):
-            return "0x" + bytes(value).hex()
-        if isinstance(value, dict):
-            return {str(key): cls._to_json_safe(item) for key, item in value.items()}
-        if isinstance(value, (list, tuple, set)):
-            return [cls._to_json_safe(item) for item in value]
-        if hasattr(value, "hex"):
-            try:
-                hex_value = value.hex()
-                if isinstance(hex_value, str):
-                    return hex_value if hex_value.startswith("0x") else f"0x{hex_value}"
-            except Exception:
-                pass
-        if hasattr(value, "__dict__"):
-            return cls._to_json_safe(vars(value))
-        return str(value)
+    # Shared with the response encoder; see app.json_safe.
+    _to_json_safe = staticmethod(to_json_safe)
 
     def _normalize_sdk_error(
         self,
@@ -127,49 +321,17 @@ class BaseManager:
         exc: Exception,
     ) -> OstiumServiceError:
         raw_error = str(exc)
-        lower_error = raw_error.lower()
         details = {"error": raw_error, "operation": operation}
 
-        if "sufficient allowance" in lower_error or "allowance for" in lower_error:
-            return OstiumServiceError(
-                code="ALLOWANCE_MISSING",
-                message="Sufficient allowance not present. Approve the trading contract to spend USDC.",
-                status_code=400,
-                retryable=False,
-                details=details,
-            )
-        if "delegation is not active" in lower_error or "delegation not active" in lower_error:
-            return OstiumServiceError(
-                code="DELEGATION_NOT_ACTIVE",
-                message="Delegation is not active. Approve delegation before write actions.",
-                status_code=400,
-                retryable=False,
-                details=details,
-            )
-        if "safe wallet not found" in lower_error:
-            return OstiumServiceError(
-                code="SAFE_WALLET_MISSING",
-                message="Safe wallet not found for selected network.",
-                status_code=400,
-                retryable=False,
-                details=details,
-            )
-        if "delegate wallet gas is low" in lower_error or "insufficient funds for gas" in lower_error:
-            return OstiumServiceError(
-                code="DELEGATE_GAS_LOW",
-                message="Delegate wallet gas is low. Fund delegate wallet with ETH.",
-                status_code=400,
-                retryable=False,
-                details=details,
-            )
-        if "timeout" in lower_error or "timed out" in lower_error:
-            return OstiumServiceError(
-                code="OSTIUM_SERVICE_TIMEOUT",
-                message="Ostium service timed out.",
-                status_code=504,
-                retryable=True,
-                details=details,
-            )
+        for pattern, code, message, status_code, retryable in _SDK_ERROR_RULES:
+            if pattern.search(raw_error):
+                return OstiumServiceError(
+                    code=code,
+                    message=message,
+                    status_code=status_code,
+                    retryable=retryable,
+                    details=details,
+                )
         return OstiumServiceError(
             code=default_code,
             message=default_message,
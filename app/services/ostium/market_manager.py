@@ -1,13 +1,105 @@
 from __future__ import annotations
 import asyncio
-from typing import Any
+import functools
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+from app.config import Settings
 from .base import BaseManager, OstiumServiceError, LOGGER, Decimal
 
+_T = TypeVar("_T")
+
+# Price cache keys come from request input, so the cache is capped like the idempotency store.
+_PRICE_CACHE_MAX_ENTRIES = 512
+
+async def _coalesce(inflight: dict[Hashable, asyncio.Task], key: Hashable, fetch: Callable[[], Awaitable[_T]]) -> _T:
+    # Concurrent callers for the same key share one fetch, including its failure. The fetch
+    # runs as its own task and each caller awaits it through shield, so a caller that is
+    # cancelled (e.g. a client disconnect) does not cancel the fetch for everyone else.
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        inflight[key] = task
+        task.add_done_callback(functools.partial(_coalesce_done, inflight, key))
+    return await asyncio.shield(task)
+
+def _coalesce_done(inflight: dict[Hashable, asyncio.Task], key: Hashable, task: asyncio.Task) -> None:
+    if inflight.get(key) is task:
+        del inflight[key]
+    # Mark the exception retrieved; if every caller was cancelled asyncio would otherwise warn on GC.
+    if not task.cancelled():
+        task.exception()
+
+@dataclass(frozen=True, slots=True)
+class _PairsSnapshot:
+    fetched_at: float
+    pairs: list[dict[str, Any]]
+    name_to_id: dict[str, int]
+    id_to_symbol: dict[int, str | None]
+    markets: list[dict[str, Any]]
+
+    @classmethod
+    def build(cls, pairs: list[dict[str, Any]]) -> _PairsSnapshot:
+        # First match wins, mirroring the order the old linear scans walked the list in.
+        name_to_id: dict[str, int] = {}
+        id_to_symbol: dict[int, str | None] = {}
+        markets: list[dict[str, Any]] = []
+        for pair in pairs:
+            raw_id = pair.get("id") or pair.get("pairId")
+            if raw_id is None: continue
+            pair_id = int(raw_id)
+            pair_from = str(pair.get("from", "")).upper()
+            id_to_symbol.setdefault(pair_id, pair_from or None)
+            for alias in (pair_from, str(pair.get("symbol", "")).upper(), str(pair.get("name", "")).upper()):
+                if alias: name_to_id.setdefault(alias, pair_id)
+            quote = str(pair.get("to", "USD")).upper()
+            status = "paused" if pair.get("isPaused") is True else "active"
+            markets.append({"pairId": pair_id, "symbol": pair_from, "pair": f"{pair_from}/{quote}", "status": status})
+        return cls(time.monotonic(), pairs, name_to_id, id_to_symbol, markets)
+
 class MarketManager(BaseManager):
+    def __init__(self, settings: Settings):
+        super().__init__(settings)
+        self._pairs_cache: dict[str, _PairsSnapshot] = {}
+        self._pairs_ttl_seconds = settings.ostium_pairs_cache_ttl_seconds
+        self._pairs_inflight: dict[Hashable, asyncio.Task] = {}
+        # Insertion-ordered with one TTL, so expired entries and the size cap both pop from the front.
+        self._price_cache: OrderedDict[tuple[str, str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+        self._price_ttl_seconds = settings.ostium_price_cache_ttl_seconds
+        self._price_inflight: dict[Hashable, asyncio.Task] = {}
+
+    def _cached_pairs(self, network: str) -> _PairsSnapshot | None:
+        cached = self._pairs_cache.get(network)
+        if cached and time.monotonic() - cached.fetched_at < self._pairs_ttl_seconds:
+            return cached
+        return None
+
+    async def _pairs_snapshot(self, network: str) -> _PairsSnapshot:
+        snapshot = self._cached_pairs(network)
+        if snapshot is not None:
+            return snapshot
+        return await _coalesce(self._pairs_inflight, network, lambda: self._refresh_pairs(network))
+
+    async def _refresh_pairs(self, network: str) -> _PairsSnapshot:
+        try:
+            snapshot = _PairsSnapshot.build(await self._load_pairs(network))
+        except OstiumServiceError as exc:
+            if exc.code == "MARKETS_FETCH_FAILED":
+                # Drop the expired snapshot too; nothing should fall back to it after a failed refresh.
+                self._pairs_cache.pop(network, None)
+            raise
+        if snapshot.pairs:
+            self._pairs_cache[network] = snapshot
+        return snapshot
+
     async def _fetch_pairs(self, network: str) -> list[dict[str, Any]]:
+        return (await self._pairs_snapshot(network)).pairs
+
+    async def _load_pairs(self, network: str) -> list[dict[str, Any]]:
         sdk = self._build_sdk(network)
         try:
-            pairs = await asyncio.to_thread(sdk.get_formatted_pairs_details)
+            pairs = await self._run_blocking(sdk.get_formatted_pairs_details)
             if isinstance(pairs, list):
                 return pairs
         except Exception:
@@ -27,57 +119,50 @@ class MarketManager(BaseManager):
             ) from exc
         return []
 
-    async def resolve_pair_id(self, network: str, market: str) -> int:
-        if market.isdigit():
-            return int(market)
-        normalized = market.upper()
-        pairs = await self._fetch_pairs(network)
-        for pair in pairs:
-            pair_from = str(pair.get("from", "")).upper()
-            symbol = str(pair.get("symbol", "")).upper()
-            name = str(pair.get("name", "")).upper()
-            if normalized in {pair_from, symbol, name}:
-                pair_id = pair.get("id") or pair.get("pairId")
-                if pair_id is not None:
-                    return int(pair_id)
-        raise OstiumServiceError(
-            code="INVALID_MARKET",
-            message=f"Market '{market}' is not available on {network}",
-            status_code=400,
-            retryable=False,
-        )
-
-    async def resolve_pair_symbol(self, network: str, pair_id: int) -> str | None:
-        pairs = await self._fetch_pairs(network)
-        for pair in pairs:
-            current_id = pair.get("id") or pair.get("pairId")
-            if current_id is None: continue
-            if int(current_id) == pair_id:
-                symbol = str(pair.get("from", "")).upper()
-                return symbol or None
-        return None
+    async def resolve_pair(self, network: str, market: str | int) -> tuple[int, str | None]:
+        # One snapshot read serves both the id and the symbol; a fresh cache is read without awaiting.
+        snapshot = self._cached_pairs(network) or await self._pairs_snapshot(network)
+        if isinstance(market, int) or market.isdigit():
+            pair_id = int(market)
+        else:
+            pair_id = snapshot.name_to_id.get(market.upper())
+            if pair_id is None:
+                raise OstiumServiceError(
+                    code="INVALID_MARKET",
+                    message=f"Market '{market}' is not available on {network}",
+                    status_code=400,
+                    retryable=False,
+                )
+        return pair_id, snapshot.id_to_symbol.get(pair_id)
 
     async def list_markets(self, network: str) -> dict[str, Any]:
-        pairs = await self._fetch_pairs(network)
-        markets = []
-        for pair in pairs:
-            pair_id = pair.get("id") or pair.get("pairId")
-            if pair_id is None: continue
-            base = str(pair.get("from", "")).upper()
-            quote = str(pair.get("to", "USD")).upper()
-            status = "active"
-            if pair.get("isPaused") is True: status = "paused"
-            markets.append({"pairId": int(pair_id), "symbol": base, "pair": f"{base}/{quote}", "status": status})
-        return {"network": network, "markets": markets}
+        # The view is built once per cache fill and shared read-only between responses.
+        return {"network": network, "markets": (await self._pairs_snapshot(network)).markets}
 
     async def get_price(self, network: str, base: str, quote: str, detailed: bool = False) -> dict[str, Any]:
+        base_upper, quote_upper = base.upper(), quote.upper()
+        if detailed:
+            sdk = self._build_sdk(network)
+            try:
+                result = await sdk.price.get_latest_price_json(base_upper, quote_upper)
+            except Exception as exc:
+                raise OstiumServiceError(code="PRICE_FETCH_FAILED", message=f"Failed to fetch price for {base}/{quote}", status_code=502, retryable=True, details={"error": str(exc)}) from exc
+            return {"network": network, "base": base_upper, "quote": quote_upper, "priceData": self._to_json_safe(result)}
+
+        # Bursts of trades on one pair reuse a sub-second-old quote instead of each hitting the oracle.
+        key = (network, base_upper, quote_upper)
+        cached = self._price_cache.get(key)
+        if cached:
+            if time.monotonic() - cached[0] < self._price_ttl_seconds:
+                return cached[1]
+            del self._price_cache[key]
+        return await _coalesce(self._price_inflight, key, lambda: self._load_price(key, base, quote))
+
+    async def _load_price(self, key: tuple[str, str, str], base: str, quote: str) -> dict[str, Any]:
+        network, base_upper, quote_upper = key
         sdk = self._build_sdk(network)
         try:
-            if detailed:
-                result = await sdk.price.get_latest_price_json(base.upper(), quote.upper())
-                return {"network": network, "base": base.upper(), "quote": quote.upper(), "priceData": self._to_json_safe(result)}
-            
-            result = await sdk.price.get_price(base.upper(), quote.upper())
+            result = await sdk.price.get_price(base_upper, quote_upper)
             if isinstance(result, tuple):
                 price = Decimal(str(result[0])) if len(result) > 0 and result[0] is not None else None
                 is_market_open = bool(result[1]) if len(result) > 1 else None
@@ -88,7 +173,21 @@ class MarketManager(BaseManager):
         except Exception as exc:
             raise OstiumServiceError(code="PRICE_FETCH_FAILED", message=f"Failed to fetch price for {base}/{quote}", status_code=502, retryable=True, details={"error": str(exc)}) from exc
 
-        return {"network": network, "base": base.upper(), "quote": quote.upper(), "price": price, "isMarketOpen": is_market_open, "isDayTradingClosed": is_day_trading_closed}
+        response = {"network": network, "base": base_upper, "quote": quote_upper, "price": price, "isMarketOpen": is_market_open, "isDayTradingClosed": is_day_trading_closed}
+        self._store_price(key, response)
+        return response
+
+    def _store_price(self, key: tuple[str, str, str], response: dict[str, Any]) -> None:
+        now = time.monotonic()
+        cache = self._price_cache
+        cache[key] = (now, response)
+        cache.move_to_end(key)
+        cutoff = now - self._price_ttl_seconds
+        while cache:
+            fetched_at, _ = next(iter(cache.values()))
+            if fetched_at >= cutoff and len(cache) <= _PRICE_CACHE_MAX_ENTRIES:
+                break
+            cache.popitem(last=False)
 
     async def get_funding_rate(self, network: str, pair_id: int, period_hours: int = 24) -> dict[str, Any]:
         sdk = self._build_sdk(network)
@@ -1,75 +1,99 @@
 from __future__ import annotations
 import asyncio
-from typing import Any
+import copy
+import time
+from typing import Any, Callable
+from app.schemas.ostium import PositionCloseRequest, PositionMetricsRequest, PositionOpenRequest, PositionUpdateSlRequest, PositionUpdateTpRequest
 from .base import BaseManager, OstiumServiceError, Decimal
 from .market_manager import MarketManager
 
+_MAX_LEVERAGE_TTL_SECONDS = 300.0
+
 class TradingManager(BaseManager):
     def __init__(self, settings: Any, market_manager: MarketManager):
         super().__init__(settings)
         self._market_manager = market_manager
+        self._max_leverage_cache: dict[tuple[str, int], tuple[float, float]] = {}
+
+    @staticmethod
+    def _with_slippage(sdk: Any, slippage: float) -> Any:
+        # Slippage is instance state on the shared SDK. Setting it on a shallow copy of the
+        # trading client scopes it to this call, so concurrent trades neither race nor queue.
+        ostium = copy.copy(sdk.ostium)
+        setter = getattr(ostium, "set_slippage_percentage", None)
+        if setter is not None: setter(Decimal(str(slippage)))
+        return ostium
+
+    async def _fetch_max_leverage(self, sdk: Any, network: str, pair_id: int) -> float | None:
+        cached = self._max_leverage_cache.get((network, pair_id))
+        if cached and time.monotonic() - cached[0] < _MAX_LEVERAGE_TTL_SECONDS:
+            return cached[1]
+        # The leverage check is best-effort; an SDK failure or a value that is not a
+        # number must not block the trade.
+        try:
+            max_leverage = float(await sdk.get_pair_max_leverage(pair_id))
+        except Exception:
+            return None
+        self._max_leverage_cache[(network, pair_id)] = (time.monotonic(), max_leverage)
+        return max_leverage
 
-    async def open_position(self, payload: dict[str, Any]) -> dict[str, Any]:
-        existing = self._idempotency_get(payload.get("idempotencyKey"))
-        if existing: return existing
+    async def open_position(self, req: PositionOpenRequest) -> dict[str, Any]:
+        return await self._idempotent("open_position", req.idempotencyKey, self._open_position, req)
 
-        network = payload["network"]
-        trader_address = payload.get("traderAddress")
-        pair_id = await self._market_manager.resolve_pair_id(network, payload["market"])
-        side = str(payload["side"]).lower()
-        order_type = str(payload.get("orderType", "market")).upper()
-        trigger_price = payload.get("triggerPrice")
-        slippage = float(payload.get("slippage", 2.0))
+    async def _open_position(self, req: PositionOpenRequest) -> dict[str, Any]:
+        network = req.network
+        pair_id, symbol = await self._market_manager.resolve_pair(network, req.market)
+        order_type = req.orderType.upper()
 
         delegate_key = self._ensure_delegate_key()
         sdk = self._build_sdk(network, private_key=delegate_key)
 
-        try:
-            max_leverage = await sdk.get_pair_max_leverage(pair_id)
-            if float(payload["leverage"]) > max_leverage:
-                raise OstiumServiceError(code="LEVERAGE_TOO_HIGH", message=f"Leverage exceeds maximum of {max_leverage}x", status_code=400)
-        except Exception as exc:
-            if isinstance(exc, OstiumServiceError): raise
-        
-        symbol = await self._market_manager.resolve_pair_symbol(network, pair_id)
         if not symbol: raise OstiumServiceError(code="INVALID_MARKET", message=f"Could not resolve symbol for pairId={pair_id}", status_code=400)
 
+        # The leverage cap and market price are independent reads, so fetch them together;
+        # a leverage breach is still reported ahead of a price failure.
         if order_type == "MARKET":
-            price_data = await self._market_manager.get_price(network, symbol, "USD")
+            max_leverage, price_data = await asyncio.gather(
+                self._fetch_max_leverage(sdk, network, pair_id),
+                self._market_manager.get_price(network, symbol, "USD"),
+                return_exceptions=True,
+            )
+        else:
+            max_leverage, price_data = await self._fetch_max_leverage(sdk, network, pair_id), None
+        if max_leverage is not None and req.leverage > max_leverage:
+            raise OstiumServiceError(code="LEVERAGE_TOO_HIGH", message=f"Leverage exceeds maximum of {max_leverage:g}x", status_code=400)
+
+        if order_type == "MARKET":
+            if isinstance(price_data, BaseException): raise price_data
             at_price = price_data.get("price")
             if at_price is None: raise OstiumServiceError(code="PRICE_FETCH_FAILED", message=f"Could not determine market price", status_code=502)
         else:
-            if trigger_price is None: raise OstiumServiceError(code="TRIGGER_PRICE_REQUIRED", message=f"triggerPrice is required", status_code=400)
-            at_price = trigger_price
+            if req.triggerPrice is None: raise OstiumServiceError(code="TRIGGER_PRICE_REQUIRED", message=f"triggerPrice is required", status_code=400)
+            at_price = req.triggerPrice
 
-        trade_params = {"asset_type": pair_id, "collateral": Decimal(str(payload["collateral"])), "direction": side == "long", "leverage": Decimal(str(payload["leverage"])), "order_type": order_type}
-        if payload.get("slPrice") is not None: trade_params["sl"] = Decimal(str(payload["slPrice"]))
-        if payload.get("tpPrice") is not None: trade_params["tp"] = Decimal(str(payload["tpPrice"]))
-        if trader_address: trade_params["trader_address"] = trader_address
+        trade_params = {"asset_type": pair_id, "collateral": Decimal(str(req.collateral)), "direction": req.side == "long", "leverage": Decimal(str(req.leverage)), "order_type": order_type}
+        if req.slPrice is not None: trade_params["sl"] = Decimal(str(req.slPrice))
+        if req.tpPrice is not None: trade_params["tp"] = Decimal(str(req.tpPrice))
+        if req.traderAddress: trade_params["trader_address"] = req.traderAddress
 
         try:
-            if hasattr(sdk.ostium, "set_slippage_percentage"): sdk.ostium.set_slippage_percentage(Decimal(str(slippage)))
-            result = await asyncio.to_thread(sdk.ostium.perform_trade, trade_params, Decimal(str(at_price)))
+            ostium = self._with_slippage(sdk, req.slippage)
+            result = await self._run_blocking(ostium.perform_trade, trade_params, Decimal(str(at_price)))
         except Exception as exc:
             raise self._normalize_sdk_error("open_position", "OPEN_POSITION_FAILED", "Failed to open position", exc) from exc
 
-        response = {"network": network, "pairId": pair_id, "orderType": order_type, "triggerPrice": float(at_price), "status": "submitted", "result": self._to_json_safe(result)}
-        self._idempotency_set(payload.get("idempotencyKey"), response)
-        return response
+        return {"network": network, "pairId": pair_id, "orderType": order_type, "triggerPrice": float(at_price), "status": "submitted", "result": self._to_json_safe(result)}
 
-    async def close_position(self, payload: dict[str, Any]) -> dict[str, Any]:
-        existing = self._idempotency_get(payload.get("idempotencyKey"))
-        if existing: return existing
+    async def close_position(self, req: PositionCloseRequest) -> dict[str, Any]:
+        return await self._idempotent("close_position", req.idempotencyKey, self._close_position, req)
 
-        network = payload["network"]
-        pair_id, trade_index = int(payload["pairId"]), int(payload["tradeIndex"])
-        trader_address = payload.get("traderAddress")
-        close_percentage, slippage = float(payload.get("closePercentage", 100.0)), float(payload.get("slippage", 2.0))
+    async def _close_position(self, req: PositionCloseRequest) -> dict[str, Any]:
+        network, pair_id, trade_index = req.network, req.pairId, req.tradeIndex
 
         delegate_key = self._ensure_delegate_key()
         sdk = self._build_sdk(network, private_key=delegate_key)
 
-        symbol = await self._market_manager.resolve_pair_symbol(network, pair_id)
+        _, symbol = await self._market_manager.resolve_pair(network, pair_id)
         if not symbol: raise OstiumServiceError(code="INVALID_MARKET", message="Could not resolve symbol", status_code=400)
 
         price_data = await self._market_manager.get_price(network, symbol, "USD")
@@ -77,40 +101,43 @@ class TradingManager(BaseManager):
         if market_price is None: raise OstiumServiceError(code="PRICE_FETCH_FAILED", message="Could not determine price", status_code=502)
 
         try:
-            if hasattr(sdk.ostium, "set_slippage_percentage"): sdk.ostium.set_slippage_percentage(Decimal(str(slippage)))
-            result = await asyncio.to_thread(sdk.ostium.close_trade, pair_id=pair_id, trade_index=trade_index, market_price=Decimal(str(market_price)), close_percentage=Decimal(str(close_percentage)), trader_address=trader_address)
+            ostium = self._with_slippage(sdk, req.slippage)
+            result = await self._run_blocking(ostium.close_trade, pair_id=pair_id, trade_index=trade_index, market_price=Decimal(str(market_price)), close_percentage=Decimal(str(req.closePercentage)), trader_address=req.traderAddress)
         except Exception as exc:
             raise self._normalize_sdk_error("close_position", "CLOSE_POSITION_FAILED", "Failed to close position", exc) from exc
 
-        response = {"network": network, "pairId": pair_id, "tradeIndex": trade_index, "status": "submitted", "result": self._to_json_safe(result)}
-        self._idempotency_set(payload.get("idempotencyKey"), response)
-        return response
-
-    async def update_sl(self, payload: dict[str, Any]) -> dict[str, Any]:
-        network, pair_id, trade_index, sl_price = payload["network"], int(payload["pairId"]), int(payload["tradeIndex"]), float(payload["slPrice"])
-        trader_address = payload.get("traderAddress")
-        sdk = self._build_sdk(network, private_key=self._ensure_delegate_key())
-        try:
-            result = await asyncio.to_thread(sdk.ostium.update_sl, pair_id=pair_id, trade_index=trade_index, sl_price=Decimal(str(sl_price)), trader_address=trader_address)
-        except Exception as exc:
-            raise self._normalize_sdk_error("update_sl", "UPDATE_SL_FAILED", "Failed to update SL", exc) from exc
-        return {"network": network, "pairId": pair_id, "tradeIndex": trade_index, "slPrice": sl_price, "status": "submitted", "result": self._to_json_safe(result)}
-
-    async def update_tp(self, payload: dict[str, Any]) -> dict[str, Any]:
-        network, pair_id, trade_index, tp_price = payload["network"], int(payload["pairId"]), int(payload["tradeIndex"]), float(payload["tpPrice"])
-        trader_address = payload.get("traderAddress")
-        sdk = self._build_sdk(network, private_key=self._ensure_delegate_key())
+        return {"network": network, "pairId": pair_id, "tradeIndex": trade_index, "status": "submitted", "result": self._to_json_safe(result)}
+
+    async def update_sl(self, req: PositionUpdateSlRequest) -> dict[str, Any]:
+        sdk = self._build_sdk(req.network, private_key=self._ensure_delegate_key())
+        result = await self._update_trigger(req, sdk.ostium.update_sl, "update_sl", "UPDATE_SL_FAILED", "Failed to update SL", sl_price=Decimal(str(req.slPrice)))
+        return {"network": req.network, "pairId": req.pairId, "tradeIndex": req.tradeIndex, "slPrice": req.slPrice, "status": "submitted", "result": result}
+
+    async def update_tp(self, req: PositionUpdateTpRequest) -> dict[str, Any]:
+        sdk = self._build_sdk(req.network, private_key=self._ensure_delegate_key())
+        result = await self._update_trigger(req, sdk.ostium.update_tp, "update_tp", "UPDATE_TP_FAILED", "Failed to update TP", tp_price=Decimal(str(req.tpPrice)))
+        return {"network": req.network, "pairId": req.pairId, "tradeIndex": req.tradeIndex, "tpPrice": req.tpPrice, "status": "submitted", "result": result}
+
+    async def _update_trigger(
+        self,
+        req: PositionUpdateSlRequest | PositionUpdateTpRequest,
+        sdk_call: Callable[..., Any],
+        operation: str,
+        error_code: str,
+        error_message: str,
+        **price: Decimal,
+    ) -> Any:
+        # SL and TP updates differ only in the SDK method, its price keyword and their error code.
         try:
-            result = await asyncio.to_thread(sdk.ostium.update_tp, pair_id=pair_id, trade_index=trade_index, tp_price=Decimal(str(tp_price)), trader_address=trader_address)
+            result = await self._run_blocking(sdk_call, pair_id=req.pairId, trade_index=req.tradeIndex, trader_address=req.traderAddress, **price)
         except Exception as exc:
-            raise self._normalize_sdk_error("update_tp", "UPDATE_TP_FAILED", "Failed to update TP", exc) from exc
-        return {"network": network, "pairId": pair_id, "tradeIndex": trade_index, "tpPrice": tp_price, "status": "submitted", "result": self._to_json_safe(result)}
+            raise self._normalize_sdk_error(operation, error_code, error_message, exc) from exc
+        return self._to_json_safe(result)
 
-    async def get_position_metrics(self, payload: dict[str, Any]) -> dict[str, Any]:
-        network, pair_id, trade_index, trader_address = payload["network"], int(payload["pairId"]), int(payload["tradeIndex"]), payload.get("traderAddress")
-        sdk = self._build_sdk(network, private_key=self._ensure_delegate_key())
+    async def get_position_metrics(self, req: PositionMetricsRequest) -> dict[str, Any]:
+        sdk = self._build_sdk(req.network, private_key=self._ensure_delegate_key())
         try:
-            metrics = await sdk.get_open_trade_metrics(pair_id=pair_id, trade_index=trade_index, trader_address=trader_address)
+            metrics = await sdk.get_open_trade_metrics(pair_id=req.pairId, trade_index=req.tradeIndex, trader_address=req.traderAddress)
         except Exception as exc:
             raise OstiumServiceError(code="METRICS_FETCH_FAILED", message="Failed to fetch metrics", status_code=502, details={"error": str(exc)}) from exc
-        return {"network": network, "pairId": pair_id, "tradeIndex": trade_index, "metrics": self._to_json_safe(metrics)}
+        return {"network": req.network, "pairId": req.pairId, "tradeIndex": req.tradeIndex, "metrics": self._to_json_safe(metrics)}
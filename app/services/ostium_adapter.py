@@ -1,7 +1,16 @@
 from __future__ import annotations
 from typing import Any
 from app.config import Settings
-from .ostium.base import OstiumServiceError
+from app.schemas.ostium import (
+    OrderCancelRequest,
+    OrderUpdateRequest,
+    PositionCloseRequest,
+    PositionMetricsRequest,
+    PositionOpenRequest,
+    PositionUpdateSlRequest,
+    PositionUpdateTpRequest,
+)
+from .ostium.base import OstiumServiceError, close_sdk_clients, shutdown_sdk_executor
 from .ostium.market_manager import MarketManager
 from .ostium.trading_manager import TradingManager
 from .ostium.order_manager import OrderManager
@@ -21,6 +30,10 @@ class OstiumAdapter:
         # Since we use sdk internal to managers, we just assume it's ready if managers can init
         return True, None
 
+    async def aclose(self) -> None:
+        await close_sdk_clients()
+        shutdown_sdk_executor()
+
     # Redirect methods to domain managers
     async def list_markets(self, network: str) -> dict[str, Any]:
         return await self.market.list_markets(network)
@@ -34,17 +47,17 @@ class OstiumAdapter:
     async def list_positions(self, network: str, trader_address: str) -> dict[str, Any]:
         return await self.accounts.list_positions(network, trader_address)
 
-    async def open_position(self, payload: dict[str, Any]) -> dict[str, Any]:
-        return await self.trading.open_position(payload)
+    async def open_position(self, req: PositionOpenRequest) -> dict[str, Any]:
+        return await self.trading.open_position(req)
 
-    async def close_position(self, payload: dict[str, Any]) -> dict[str, Any]:
-        return await self.trading.close_position(payload)
+    async def close_position(self, req: PositionCloseRequest) -> dict[str, Any]:
+        return await self.trading.close_position(req)
 
-    async def update_sl(self, payload: dict[str, Any]) -> dict[str, Any]:
-        return await self.trading.update_sl(payload)
+    async def update_sl(self, req: PositionUpdateSlRequest) -> dict[str, Any]:
+        return await self.trading.update_sl(req)
 
-    async def update_tp(self, payload: dict[str, Any]) -> dict[str, Any]:
-        return await self.trading.update_tp(payload)
+    async def update_tp(self, req: PositionUpdateTpRequest) -> dict[str, Any]:
+        return await self.trading.update_tp(req)
 
     async def list_orders(self, network: str, trader_address: str) -> dict[str, Any]:
         return await self.orders.list_orders(network, trader_address)
@@ -52,17 +65,20 @@ class OstiumAdapter:
     async def get_history(self, network: str, trader_address: str, limit: int = 20) -> dict[str, Any]:
         return await self.accounts.get_history(network, trader_address, limit)
 
-    async def cancel_order(self, payload: dict[str, Any]) -> dict[str, Any]:
-        return await self.orders.cancel_order(payload)
+    async def get_account_snapshot(self, network: str, trader_address: str, history_limit: int = 20) -> dict[str, Any]:
+        return await self.accounts.get_account_snapshot(network, trader_address, history_limit)
+
+    async def cancel_order(self, req: OrderCancelRequest) -> dict[str, Any]:
+        return await self.orders.cancel_order(req)
 
-    async def update_order(self, payload: dict[str, Any]) -> dict[str, Any]:
-        return await self.orders.update_order(payload)
+    async def update_order(self, req: OrderUpdateRequest) -> dict[str, Any]:
+        return await self.orders.update_order(req)
 
     async def track_order(self, network: str, order_id: str) -> dict[str, Any]:
         return await self.orders.track_order(network, order_id)
 
-    async def get_position_metrics(self, payload: dict[str, Any]) -> dict[str, Any]:
-        return await self.trading.get_position_metrics(payload)
+    async def get_position_metrics(self, req: PositionMetricsRequest) -> dict[str, Any]:
+        return await self.trading.get_position_metrics(req)
 
     async def get_funding_rate(self, network: str, pair_id: int, period_hours: int = 24) -> dict[str, Any]:
         return await self.market.get_funding_rate(network, pair_id, period_hours)
@@ -0,0 +1,165 @@
+import asyncio
+import dataclasses
+import hashlib
+import hmac
+import time
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.config import load_settings
+from app.middleware.hmac_auth import HmacAuthMiddleware
+
+SECRET = "test-secret"
+MAX_BODY_BYTES = 64
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.post("/v1/echo")
+    async def echo(request: Request):
+        return {"body": (await request.body()).decode()}
+
+    settings = dataclasses.replace(load_settings(), hmac_secret=SECRET, max_request_body_bytes=MAX_BODY_BYTES)
+    app.add_middleware(HmacAuthMiddleware, settings=settings)
+    return app
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(_build_app())
+
+
+def _sign(timestamp: str, method: str, path: str, body: bytes) -> str:
+    message = f"{timestamp}:{method}:{path}:".encode() + body
+    return hmac.new(SECRET.encode(), message, hashlib.sha256).hexdigest()
+
+
+def _headers(body: bytes, timestamp: str | None = None, signature: str | None = None) -> dict[str, str]:
+    timestamp = timestamp or str(time.time_ns() // 1_000_000)
+    return {
+        "x-timestamp": timestamp,
+        "x-signature": signature or _sign(timestamp, "POST", "/v1/echo", body),
+        "content-type": "application/json",
+    }
+
+
+def _error_code(response) -> str:
+    return response.json()["error"]["code"]
+
+
+def test_valid_signature_reaches_route_with_body_intact(client):
+    body = b'{"hello":"world"}'
+
+    response = client.post("/v1/echo", content=body, headers=_headers(body))
+
+    assert response.status_code == 200
+    assert response.json() == {"body": body.decode()}
+
+
+def test_wrong_signature_is_rejected(client):
+    body = b'{"hello":"world"}'
+    headers = _headers(body, signature=_sign("1", "POST", "/v1/echo", body))
+
+    response = client.post("/v1/echo", content=body, headers=headers)
+
+    assert response.status_code == 401
+    assert response.json()["error"]["message"] == "Invalid signature"
+
+
+def test_tampered_body_is_rejected(client):
+    headers = _headers(b'{"amount":1}')
+
+    response = client.post("/v1/echo", content=b'{"amount":9}', headers=headers)
+
+    assert response.status_code == 401
+
+
+def test_non_hex_signature_is_rejected(client):
+    body = b"{}"
+
+    response = client.post("/v1/echo", content=body, headers=_headers(body, signature="not-hex"))
+
+    assert response.status_code == 401
+    assert response.json()["error"]["message"] == "Invalid signature"
+
+
+@pytest.mark.parametrize("missing", ["x-timestamp", "x-signature"])
+def test_missing_headers_are_rejected(client, missing):
+    body = b"{}"
+    headers = _headers(body)
+    del headers[missing]
+
+    response = client.post("/v1/echo", content=body, headers=headers)
+
+    assert response.status_code == 401
+    assert response.json()["error"]["message"] == "Missing required authentication headers"
+
+
+def test_expired_timestamp_is_rejected(client):
+    body = b"{}"
+    timestamp = str(time.time_ns() // 1_000_000 - load_settings().hmac_timestamp_tolerance_ms - 60_000)
+
+    response = client.post("/v1/echo", content=body, headers=_headers(body, timestamp=timestamp))
+
+    assert response.status_code == 401
+    assert response.json()["error"]["message"] == "Request expired or timestamp too far in future"
+
+
+def test_content_length_over_limit_is_rejected(client):
+    body = b"x" * (MAX_BODY_BYTES + 1)
+
+    response = client.post("/v1/echo", content=body, headers=_headers(body))
+
+    assert response.status_code == 413
+    assert _error_code(response) == "PAYLOAD_TOO_LARGE"
+
+
+def test_chunked_body_over_limit_is_rejected():
+    # Drives the ASGI app directly so the body arrives in several messages without Content-Length.
+    chunks = [b"x" * 40, b"x" * 40]
+    timestamp = str(time.time_ns() // 1_000_000)
+    signature = _sign(timestamp, "POST", "/v1/echo", b"".join(chunks))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/v1/echo",
+        "raw_path": b"/v1/echo",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"x-timestamp", timestamp.encode()), (b"x-signature", signature.encode())],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+        for index, chunk in enumerate(chunks)
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(_build_app()(scope, receive, send))
+
+    assert sent[0]["status"] == 413
+    assert b"PAYLOAD_TOO_LARGE" in sent[1]["body"]
+
+
+def test_health_skips_authentication(client):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy"}
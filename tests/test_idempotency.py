@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from app.config import load_settings
+from app.services.ostium import base
+from app.services.ostium.base import BaseManager
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(base, "_IDEMPOTENCY", None)
+    return BaseManager(load_settings())
+
+
+def test_same_key_on_different_operations_runs_both(manager):
+    calls = []
+
+    async def operation(req):
+        calls.append(req)
+        return {"request": req}
+
+    async def run():
+        first = await manager._idempotent("open_position", "key-1", operation, "open")
+        second = await manager._idempotent("cancel_order", "key-1", operation, "cancel")
+        replay = await manager._idempotent("open_position", "key-1", operation, "open-again")
+        return first, second, replay
+
+    first, second, replay = asyncio.run(run())
+
+    assert calls == ["open", "cancel"]
+    assert first == replay == {"request": "open"}
+    assert second == {"request": "cancel"}
+
+
+def test_duplicates_in_flight_share_the_owner_failure(manager):
+    calls = []
+
+    async def operation(req):
+        calls.append(req)
+        await asyncio.sleep(0.01)
+        raise base.OstiumServiceError(code="TRADE_FAILED", message="boom", status_code=502)
+
+    async def run():
+        return await asyncio.gather(
+            *(manager._idempotent("open_position", "key-1", operation, index) for index in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    assert calls == [0]
+    assert all(isinstance(result, base.OstiumServiceError) and result.code == "TRADE_FAILED" for result in results)
+
+
+def test_retry_after_failure_runs_again(manager):
+    calls = []
+
+    async def operation(req):
+        calls.append(req)
+        if len(calls) == 1:
+            raise RuntimeError("transient")
+        return {"ok": True}
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await manager._idempotent("cancel_order", "key-1", operation, "first")
+        return await manager._idempotent("cancel_order", "key-1", operation, "retry")
+
+    assert asyncio.run(run()) == {"ok": True}
+    assert calls == ["first", "retry"]
@@ -0,0 +1,43 @@
+import json
+from decimal import Decimal
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.routes.v1.common import EnvelopeResponse, handle_ostium_errors
+
+
+def test_int_wider_than_64_bits_is_encoded():
+    body = EnvelopeResponse({"amount": 2**70, "price": Decimal("1.50"), "ids": [1, 2]}).body
+
+    assert json.loads(body) == {"amount": 2**70, "price": "1.50", "ids": [1, 2]}
+
+
+def test_non_str_keys_are_encoded():
+    body = EnvelopeResponse({1: "a", "big": -(2**80)}).body
+
+    assert json.loads(body) == {"1": "a", "big": -(2**80)}
+
+
+class Cyclic:
+    def __init__(self):
+        self.parent = self
+
+
+class EmptyRequest(BaseModel):
+    pass
+
+
+def test_cyclic_object_becomes_error_envelope():
+    app = FastAPI()
+
+    @app.post("/cyclic")
+    @handle_ostium_errors("cyclic")
+    async def cyclic(payload: EmptyRequest, request: Request):
+        return {"value": Cyclic()}
+
+    response = TestClient(app).post("/cyclic", json={})
+
+    assert response.status_code == 500
+    assert response.json()["error"]["code"] == "OSTIUM_INTERNAL_ERROR"
@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+import pytest
+
+from app.json_safe import to_json_safe
+
+
+@dataclass
+class Node:
+    value: Decimal
+    child: "Node | None" = None
+
+
+def test_deeply_nested_dataclasses_do_not_recurse():
+    depth = 3000
+    chain = None
+    for index in range(depth):
+        chain = Node(Decimal(index), chain)
+
+    converted = to_json_safe(chain)
+
+    seen = 0
+    while converted is not None:
+        assert converted["value"] == str(depth - 1 - seen)
+        converted = converted["child"]
+        seen += 1
+    assert seen == depth
+
+
+def test_dataclass_fields_are_converted():
+    assert to_json_safe([Node(Decimal("1.50"), Node(Decimal("2")))]) == [
+        {"value": "1.50", "child": {"value": "2", "child": None}}
+    ]
+
+
+class Holder:
+    def __init__(self):
+        self.parent = self
+        self.items = [1, 2]
+
+
+def test_cyclic_object_raises():
+    with pytest.raises(ValueError, match="Circular reference"):
+        to_json_safe(Holder())
+
+
+def test_cyclic_dataclass_raises():
+    node = Node(Decimal("1"))
+    node.child = node
+
+    with pytest.raises(ValueError, match="Circular reference"):
+        to_json_safe({"node": node})
+
+
+def test_shared_references_are_not_cycles():
+    shared = Node(Decimal("1"))
+
+    assert to_json_safe([shared, {"again": shared}]) == [
+        {"value": "1", "child": None},
+        {"again": {"value": "1", "child": None}},
+    ]
+
+
+def test_cyclic_plain_containers_raise():
+    cyclic_dict = {"a": 1}
+    cyclic_dict["self"] = cyclic_dict
+    cyclic_list = [1]
+    cyclic_list.append(cyclic_list)
+
+    for value in (cyclic_dict, cyclic_list):
+        with pytest.raises(ValueError, match="Circular reference"):
+            to_json_safe(value)
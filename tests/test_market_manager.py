@@ -0,0 +1,54 @@
+import asyncio
+
+from app.config import load_settings
+from app.services.ostium import market_manager
+from app.services.ostium.market_manager import MarketManager
+
+
+class FakePriceClient:
+    def __init__(self):
+        self.calls = []
+
+    async def get_price(self, base, quote):
+        self.calls.append((base, quote))
+        return (100.0, True, False)
+
+
+class FakeSdk:
+    def __init__(self):
+        self.price = FakePriceClient()
+
+
+def _manager(sdk):
+    manager = MarketManager(load_settings())
+    manager._build_sdk = lambda network, private_key=None: sdk
+    return manager
+
+
+def test_price_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(market_manager, "_PRICE_CACHE_MAX_ENTRIES", 3)
+    manager = _manager(FakeSdk())
+
+    async def run():
+        for base in ("A", "B", "C", "D", "E"):
+            await manager.get_price("testnet", base, "USD")
+
+    asyncio.run(run())
+
+    assert list(manager._price_cache) == [("testnet", base, "USD") for base in ("C", "D", "E")]
+
+
+def test_expired_price_is_dropped_on_read():
+    sdk = FakeSdk()
+    manager = _manager(sdk)
+    manager._price_ttl_seconds = 0.0
+
+    async def run():
+        await manager.get_price("testnet", "BTC", "USD")
+        manager._price_cache[("testnet", "ETH", "USD")] = (0.0, {"price": 1})
+        await manager.get_price("testnet", "ETH", "USD")
+
+    asyncio.run(run())
+
+    assert sdk.price.calls == [("BTC", "USD"), ("ETH", "USD")]
+    assert ("testnet", "BTC", "USD") not in manager._price_cache
@@ -0,0 +1,52 @@
+import json
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.routes.v1 import common
+from app.routes.v1.common import handle_ostium_errors
+
+
+class ItemsRequest(BaseModel):
+    items: list
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+
+    @app.post("/items")
+    @handle_ostium_errors("items", stream_list="items")
+    async def items(payload: ItemsRequest, request: Request):
+        return {"count": len(payload.items), "items": payload.items}
+
+    return TestClient(app)
+
+
+def _post(items):
+    return _client().post("/items", json={"items": items})
+
+
+def test_streamed_list_matches_single_body():
+    items = [{"index": index, "amount": 2**70} for index in range(common._STREAM_BATCH_SIZE * 2 + 3)]
+
+    response = _post(items)
+
+    assert response.status_code == 200
+    body = json.loads(response.content)
+    assert body["success"] is True
+    assert body["data"] == {"count": len(items), "items": items}
+
+
+def test_encode_failure_in_first_batch_returns_error_envelope(monkeypatch):
+    def fail(item):
+        raise TypeError("not encodable")
+
+    monkeypatch.setattr(common, "_encode_items", fail)
+
+    response = _post([1, 2, 3])
+
+    assert response.status_code == 500
+    body = response.json()
+    assert body["success"] is False
+    assert body["error"]["code"] == "OSTIUM_INTERNAL_ERROR"
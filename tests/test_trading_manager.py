@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from app.config import load_settings
+from app.schemas.ostium import PositionOpenRequest
+from app.services.ostium.base import OstiumServiceError
+from app.services.ostium.trading_manager import TradingManager
+
+
+class FakeOstium:
+    def __init__(self):
+        self.slippage = None
+        self.trades = []
+        # Shared by the per-call copies the manager makes of this client.
+        self.stats = {"active": 0, "max_active": 0}
+        self._lock = threading.Lock()
+
+    def set_slippage_percentage(self, slippage):
+        self.slippage = slippage
+
+    def perform_trade(self, params, at_price):
+        with self._lock:
+            self.stats["active"] += 1
+            self.stats["max_active"] = max(self.stats["max_active"], self.stats["active"])
+        time.sleep(0.05)
+        with self._lock:
+            self.stats["active"] -= 1
+            self.trades.append(self.slippage)
+        return {"orderId": len(self.trades)}
+
+
+class FakeSdk:
+    def __init__(self, max_leverage=100):
+        self.ostium = FakeOstium()
+        self.max_leverage = max_leverage
+
+    async def get_pair_max_leverage(self, pair_id):
+        return self.max_leverage
+
+
+class FakeMarketManager:
+    async def resolve_pair(self, network, market):
+        return 1, "BTC"
+
+    async def get_price(self, network, base, quote):
+        return {"price": 100.0}
+
+
+def _manager(sdk):
+    manager = TradingManager(load_settings(), FakeMarketManager())
+    manager._delegate_key = "0x" + "1" * 64
+    manager._build_sdk = lambda network, private_key=None: sdk
+    return manager
+
+
+def _open_request(**overrides):
+    fields = {"network": "testnet", "market": "BTC", "side": "long", "collateral": 10, "leverage": 5}
+    return PositionOpenRequest(**{**fields, **overrides})
+
+
+def test_concurrent_trades_keep_their_own_slippage():
+    sdk = FakeSdk()
+    manager = _manager(sdk)
+
+    async def run():
+        await asyncio.gather(*(manager.open_position(_open_request(slippage=value)) for value in (1.0, 2.0, 3.0)))
+
+    asyncio.run(run())
+
+    assert sorted(sdk.ostium.trades) == [1, 2, 3]
+    assert sdk.ostium.stats["max_active"] > 1
+    assert sdk.ostium.slippage is None
+
+
+@pytest.mark.parametrize("max_leverage", [None, "n/a", object()])
+def test_unusable_max_leverage_does_not_block_the_trade(max_leverage):
+    sdk = FakeSdk(max_leverage=max_leverage)
+
+    result = asyncio.run(_manager(sdk).open_position(_open_request(leverage=500)))
+
+    assert result["status"] == "submitted"
+
+
+def test_leverage_above_max_is_rejected():
+    sdk = FakeSdk(max_leverage=Decimal("50"))
+
+    with pytest.raises(OstiumServiceError) as exc_info:
+        asyncio.run(_manager(sdk).open_position(_open_request(leverage=60)))
+
+    assert exc_info.value.code == "LEVERAGE_TOO_HIGH"
+    assert sdk.ostium.trades == []